@@ -5,12 +5,131 @@ Fixed Advanced Music News Classifier - AI 요약 기능 활성화
 
 import re
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Set, Tuple
+
+from keyword_matcher import KeywordMatcher
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def _is_word_char(char: str) -> bool:
+    """정규식 \\w와 같은 기준의 단어 문자 여부"""
+    return char.isalnum() or char == '_'
+
+
+# 분류 키워드 정의 (모든 인스턴스가 공유하는 읽기 전용 어휘)
+_CATEGORY_KEYWORDS = {
+    'NEWS': (
+        'announces', 'releases', 'debuts', 'signs', 'tour', 'concert', 'collaboration',
+        'drops', 'unveils', 'shares', 'confirms', 'premieres'
+    ),
+    'REPORT': (
+        'chart', 'sales', 'revenue', 'market', 'statistics', 'data', 'analysis',
+        'earnings', 'profits', 'streaming', 'numbers'
+    ),
+    'INSIGHT': (
+        'trend', 'prediction', 'future', 'impact', 'influence', 'change',
+        'analysis', 'perspective', 'opinion', 'commentary'
+    ),
+    'INTERVIEW': (
+        'interview', 'talks', 'discusses', 'reveals', 'opens up', 'speaks',
+        'conversation', 'chat', 'Q&A'
+    ),
+    'COLUMN': (
+        'opinion', 'column', 'editorial', 'commentary', 'essay', 'perspective',
+        'review', 'critique', 'think piece'
+    )
+}
+
+# 태그 키워드
+_TAG_KEYWORDS = {
+    'genre': {
+        'pop': ('pop', 'mainstream', 'chart-topping'),
+        'rock': ('rock', 'alternative', 'indie', 'punk'),
+        'hip-hop': ('hip-hop', 'rap', 'trap', 'hip hop'),
+        'electronic': ('electronic', 'edm', 'dance', 'techno'),
+        'country': ('country', 'folk', 'americana'),
+        'r&b': ('r&b', 'soul', 'rnb', 'rhythm'),
+        'classical': ('classical', 'orchestra', 'symphony'),
+        'jazz': ('jazz', 'blues', 'swing'),
+        'k-pop': ('k-pop', 'kpop', 'korean pop', 'bts', 'blackpink')
+    },
+    'industry': {
+        'album': ('album', 'lp', 'record', 'ep'),
+        'single': ('single', 'track', 'song'),
+        'tour': ('tour', 'concert', 'live', 'show', 'performance'),
+        'streaming': ('spotify', 'apple music', 'streaming', 'playlist'),
+        'award': ('grammy', 'award', 'nomination', 'winner'),
+        'collaboration': ('collaboration', 'featuring', 'duet', 'feat'),
+        'label': ('label', 'record deal', 'signing', 'contract')
+    },
+    'region': {
+        'us': ('america', 'united states', 'us', 'usa', 'american'),
+        'uk': ('britain', 'british', 'uk', 'england', 'london'),
+        'korea': ('korea', 'korean', 'seoul', 'k-pop'),
+        'japan': ('japan', 'japanese', 'tokyo', 'j-pop'),
+        'global': ('global', 'worldwide', 'international', 'world')
+    }
+}
+
+# 본문은 소문자로 비교하므로 키워드도 미리 소문자로 정규화 ('Q&A' 등)
+_CATEGORY_KEYWORD_SETS = {
+    category: frozenset(keyword.lower() for keyword in keywords)
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+_TAG_KEYWORD_SETS = {
+    tag_type: {
+        tag_name: frozenset(keyword.lower() for keyword in keywords)
+        for tag_name, keywords in categories.items()
+    }
+    for tag_type, categories in _TAG_KEYWORDS.items()
+}
+
+# 태그 라벨마다 비트 하나를 배정하고, 키워드 -> 해당 키워드를 가진 라벨들의 비트마스크
+# (매칭된 키워드의 마스크를 OR 한 뒤 켜진 비트만 라벨로 변환)
+_TAG_LABELS: Tuple[Tuple[str, str], ...] = tuple(
+    (tag_type, tag_name)
+    for tag_type, categories in _TAG_KEYWORD_SETS.items()
+    for tag_name in categories
+)
+
+
+def _build_tag_keyword_masks() -> Dict[str, int]:
+    """키워드별 태그 라벨 비트마스크 생성"""
+    masks: Dict[str, int] = {}
+    for bit, (tag_type, tag_name) in enumerate(_TAG_LABELS):
+        for keyword in _TAG_KEYWORD_SETS[tag_type][tag_name]:
+            masks[keyword] = masks.get(keyword, 0) | (1 << bit)
+    return masks
+
+
+_TAG_KEYWORD_MASKS = _build_tag_keyword_masks()
+
+# 카테고리/태그 키워드 전체를 정규식 하나로 컴파일 (항목당 본문 한 번 스캔, 모듈 로드 시 한 번만 컴파일)
+_KEYWORD_MATCHER = KeywordMatcher(
+    [keyword for keywords in _CATEGORY_KEYWORD_SETS.values() for keyword in keywords] +
+    [
+        keyword
+        for categories in _TAG_KEYWORD_SETS.values()
+        for keywords in categories.values()
+        for keyword in keywords
+    ]
+)
+
+# 규칙 기반 요약 템플릿 선택 키워드 (우선순위 순서)
+_SUMMARY_TRIGGERS = (
+    ('announce', ('announces', 'reveals', 'unveils')),
+    ('release', ('releases', 'drops', 'premieres')),
+    ('live', ('tour', 'concert', 'live')),
+    ('chart', ('chart', 'number', 'top')),
+    ('collaboration', ('collaboration', 'featuring', 'feat')),
+)
+
+
 class AdvancedClassifier:
     def __init__(self, use_ai_summary: bool = False, use_claude_summary: bool = False):
         """분류기 초기화"""
@@ -29,91 +148,92 @@ class AdvancedClassifier:
                 logger.warning("🔄 규칙 기반 요약으로 대체됩니다.")
                 self.ai_summarizer = None
         
-        # 분류 키워드 정의
-        self.category_keywords = {
-            'NEWS': [
-                'announces', 'releases', 'debuts', 'signs', 'tour', 'concert', 'collaboration',
-                'drops', 'unveils', 'shares', 'confirms', 'premieres'
-            ],
-            'REPORT': [
-                'chart', 'sales', 'revenue', 'market', 'statistics', 'data', 'analysis',
-                'earnings', 'profits', 'streaming', 'numbers'
-            ],
-            'INSIGHT': [
-                'trend', 'prediction', 'future', 'impact', 'influence', 'change',
-                'analysis', 'perspective', 'opinion', 'commentary'
-            ],
-            'INTERVIEW': [
-                'interview', 'talks', 'discusses', 'reveals', 'opens up', 'speaks',
-                'conversation', 'chat', 'Q&A'
-            ],
-            'COLUMN': [
-                'opinion', 'column', 'editorial', 'commentary', 'essay', 'perspective',
-                'review', 'critique', 'think piece'
-            ]
-        }
+        # 요약 단계는 초기화 시점에 한 번만 결정 (뉴스 처리 중 분기 없음)
+        if (self.use_ai_summary or self.use_claude_summary) and self.ai_summarizer:
+            self._apply_summaries = self._apply_ai_summaries
+        else:
+            self._apply_summaries = self._apply_rule_summaries
         
-        # 태그 키워드
-        self.tag_keywords = {
-            'genre': {
-                'pop': ['pop', 'mainstream', 'chart-topping'],
-                'rock': ['rock', 'alternative', 'indie', 'punk'],
-                'hip-hop': ['hip-hop', 'rap', 'trap', 'hip hop'],
-                'electronic': ['electronic', 'edm', 'dance', 'techno'],
-                'country': ['country', 'folk', 'americana'],
-                'r&b': ['r&b', 'soul', 'rnb', 'rhythm'],
-                'classical': ['classical', 'orchestra', 'symphony'],
-                'jazz': ['jazz', 'blues', 'swing'],
-                'k-pop': ['k-pop', 'kpop', 'korean pop', 'bts', 'blackpink']
-            },
-            'industry': {
-                'album': ['album', 'lp', 'record', 'ep'],
-                'single': ['single', 'track', 'song'],
-                'tour': ['tour', 'concert', 'live', 'show', 'performance'],
-                'streaming': ['spotify', 'apple music', 'streaming', 'playlist'],
-                'award': ['grammy', 'award', 'nomination', 'winner'],
-                'collaboration': ['collaboration', 'featuring', 'duet', 'feat'],
-                'label': ['label', 'record deal', 'signing', 'contract']
-            },
-            'region': {
-                'us': ['america', 'united states', 'us', 'usa', 'american'],
-                'uk': ['britain', 'british', 'uk', 'england', 'london'],
-                'korea': ['korea', 'korean', 'seoul', 'k-pop'],
-                'japan': ['japan', 'japanese', 'tokyo', 'j-pop'],
-                'global': ['global', 'worldwide', 'international', 'world']
-            }
-        }
+        # 키워드 어휘와 매처는 모듈 수준에서 한 번만 만들고 인스턴스 간 공유
+        self.category_keywords = _CATEGORY_KEYWORDS
+        self.tag_keywords = _TAG_KEYWORDS
+        self._category_keyword_sets = _CATEGORY_KEYWORD_SETS
+        self._tag_keyword_sets = _TAG_KEYWORD_SETS
+        self._tag_labels = _TAG_LABELS
+        self._tag_keyword_masks = _TAG_KEYWORD_MASKS
+        self._keyword_matcher = _KEYWORD_MATCHER
+        self._summary_triggers = _SUMMARY_TRIGGERS
 
     def classify_category(self, title: str, description: str) -> str:
         """카테고리 분류"""
-        text = f"{title} {description}".lower()
+        return self._category_from_matches(self._keyword_matcher.find_all(f"{title} {description}".lower()))
+
+    def _category_from_matches(self, matched: Set[str]) -> str:
+        """매칭된 키워드 집합으로 카테고리 결정"""
+        if not matched:
+            return 'NEWS'
         
-        category_scores = {}
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                category_scores[category] = score
+        # 점수가 가장 높은 카테고리 (동점이면 먼저 정의된 카테고리)
+        best_category, best_score = 'NEWS', 0
+        for category, keywords in self._category_keyword_sets.items():
+            score = len(keywords & matched)
+            if score > best_score:
+                best_category, best_score = category, score
         
-        if category_scores:
-            return max(category_scores, key=category_scores.get)
-        return 'NEWS'
+        return best_category
 
     def extract_tags(self, title: str, description: str, url: str = "") -> Dict:
         """태그 추출"""
         text = f"{title} {description} {url}".lower()
-        
+        tag_mask = 0
+        for start, keyword in self._keyword_matcher.iter_matches(text):
+            if self._is_tag_word(text, start, start + len(keyword)):
+                tag_mask |= self._tag_keyword_masks.get(keyword, 0)
+        return self._tags_from_mask(tag_mask)
+
+    @staticmethod
+    def _is_tag_word(text: str, start: int, end: int) -> bool:
+        """
+        태그 키워드가 단어 단위로 등장했는지 확인
+        ('music' 안의 'us'처럼 다른 단어 일부인 경우 제외, 복수형 's'는 허용)
+        """
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end]):
+            return text[end] == 's' and (end + 1 == len(text) or not _is_word_char(text[end + 1]))
+        return True
+
+    def _tags_from_mask(self, tag_mask: int) -> Dict:
+        """태그 라벨 비트마스크를 태그 딕셔너리로 변환 (켜진 비트만 순회, 정의 순서 유지)"""
         tags = {'genre': [], 'industry': [], 'region': []}
+        while tag_mask:
+            lowest = tag_mask & -tag_mask
+            tag_type, tag_name = self._tag_labels[lowest.bit_length() - 1]
+            tags[tag_type].append(tag_name)
+            tag_mask ^= lowest
+        return tags
+
+    def _classify_and_tag(self, text: str, url: str) -> Tuple[str, Dict]:
+        """
+        소문자 '제목 설명' 문자열과 URL을 한 번 스캔해 카테고리와 태그를 함께 결정
+        (카테고리는 기존과 같이 URL 부분의 매칭을 제외, 태그는 단어 단위 매칭만 사용)
+        """
+        full_text = f"{text} {url.lower()}"
+        category_end = len(text)
+        category_matched: Set[str] = set()
+        tag_mask = 0
         
-        for tag_type, categories in self.tag_keywords.items():
-            for tag_name, keywords in categories.items():
-                if any(keyword in text for keyword in keywords):
-                    if tag_name not in tags[tag_type]:
-                        tags[tag_type].append(tag_name)
+        for start, keyword in self._keyword_matcher.iter_matches(full_text):
+            end = start + len(keyword)
+            if end <= category_end:
+                category_matched.add(keyword)
+            if self._is_tag_word(full_text, start, end):
+                tag_mask |= self._tag_keyword_masks.get(keyword, 0)
         
-        return tags
+        return self._category_from_matches(category_matched), self._tags_from_mask(tag_mask)
 
     def process_news_list_simplified(self, news_list: List[Dict]) -> List[Dict]:
-        """뉴스 리스트 처리 - AI 요약 포함된 버전"""
+        """뉴스 리스트 처리 - AI 요약 포함된 버전 (입력 항목에 결과 필드를 직접 추가)"""
         processed_news = []
         
         # 1단계: 기본 처리 (카테고리, 태그)
@@ -124,47 +244,58 @@ class AdvancedClassifier:
                 description = news.get('description', '')
                 url = news.get('url', news.get('link', ''))
                 
-                # 카테고리 분류
-                category = self.classify_category(title, description)
-                
-                # 태그 추출
-                tags = self.extract_tags(title, description, url)
+                # 카테고리 분류 및 태그 추출 (소문자 변환과 키워드 스캔은 항목당 한 번)
+                category, tags = self._classify_and_tag(f"{title} {description}".lower(), url)
                 
-                # 기본 처리된 뉴스 항목
-                processed_item = {
-                    **news,
-                    'category': category,
-                    'tags': tags,
-                    'summary': '',  # 나중에 추가
-                    'summary_type': 'pending'
-                }
-                
-                processed_news.append(processed_item)
+                # 기본 처리 결과를 원본 항목에 직접 기록 (항목별 dict 복사 생략)
+                news['category'] = category
+                news['tags'] = tags
+                news['summary'] = ''  # 나중에 추가
+                news['summary_type'] = 'pending'
                 
             except Exception as e:
                 logger.error(f"뉴스 기본 처리 오류: {e}")
-                processed_news.append({
-                    **news,
-                    'category': 'NEWS',
-                    'tags': {'genre': [], 'industry': [], 'region': []},
-                    'summary': f"음악 업계 소식: {news.get('title', '')[:50]}...",
-                    'summary_type': 'fallback'
-                })
+                news['category'] = 'NEWS'
+                news['tags'] = {'genre': [], 'industry': [], 'region': []}
+                news['summary'] = f"음악 업계 소식: {news.get('title', '')[:50]}..."
+                news['summary_type'] = 'fallback'
+            
+            processed_news.append(news)
         
-        # 2단계: AI 요약 처리
-        if (self.use_ai_summary or self.use_claude_summary) and self.ai_summarizer:
-            logger.info(f"🤖 2단계: AI 요약 생성 중... (상위 10개 뉴스)")
+        # 2단계: 요약 처리 (AI 또는 규칙 기반)
+        self._apply_summaries(processed_news)
+        
+        # 요약 통계 출력
+        summary_stats = Counter(news.get('summary_type', 'unknown') for news in processed_news)
+        
+        logger.info(f"📊 요약 생성 통계: {dict(summary_stats)}")
+        logger.info(f"✅ 총 {len(processed_news)}개 뉴스 처리 완료")
+        
+        return processed_news
+
+    def _apply_ai_summaries(self, processed_news: List[Dict]) -> None:
+        """상위 10개 뉴스는 AI 요약, 나머지는 규칙 기반 요약 적용"""
+        logger.info(f"🤖 2단계: AI 요약 생성 중... (상위 10개 뉴스)")
+        ai_targets = processed_news[:10]
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # 상위 10개 뉴스의 AI 요약(API 응답 대기)을 백그라운드에서 실행
+            ai_future = executor.submit(self.ai_summarizer.batch_summarize, ai_targets, max_items=10)
+            
+            # 그동안 나머지 뉴스는 규칙 기반 요약
+            for news in processed_news[10:]:
+                news['summary'] = self._generate_fallback_summary(news.get('title', ''), news.get('description', ''))
+                news['summary_type'] = 'rule_based'
+            
             try:
-                # 상위 10개 뉴스에 대해 AI 요약 적용
-                ai_processed = self.ai_summarizer.batch_summarize(processed_news[:10], max_items=10)
+                ai_processed = ai_future.result()
                 
                 # AI 요약 결과 병합
-                for i, news in enumerate(processed_news):
+                for i, news in enumerate(ai_targets):
                     if i < len(ai_processed):
                         news['summary'] = ai_processed[i].get('summary', self._generate_fallback_summary(news.get('title', ''), news.get('description', '')))
                         news['summary_type'] = ai_processed[i].get('summary_type', 'ai_generated')
                     else:
-                        # 나머지는 규칙 기반 요약
                         news['summary'] = self._generate_fallback_summary(news.get('title', ''), news.get('description', ''))
                         news['summary_type'] = 'rule_based'
                 
@@ -172,30 +303,19 @@ class AdvancedClassifier:
                 
             except Exception as e:
                 logger.error(f"❌ AI 요약 처리 오류: {e}")
-                # AI 실패 시 모든 뉴스에 규칙 기반 요약 적용
-                for news in processed_news:
+                # AI 실패 시 상위 10개도 규칙 기반 요약 적용 (나머지는 이미 적용됨)
+                for news in ai_targets:
                     news['summary'] = self._generate_fallback_summary(news.get('title', ''), news.get('description', ''))
                     news['summary_type'] = 'rule_based'
                 
                 logger.warning("🔄 AI 요약 실패로 규칙 기반 요약으로 대체됨")
-        
-        else:
-            # 3단계: 규칙 기반 요약만 사용
-            logger.info(f"📝 AI 요약 비활성화 - 규칙 기반 요약 적용 중...")
-            for news in processed_news:
-                news['summary'] = self._generate_fallback_summary(news.get('title', ''), news.get('description', ''))
-                news['summary_type'] = 'rule_based'
-        
-        # 요약 통계 출력
-        summary_stats = {}
+
+    def _apply_rule_summaries(self, processed_news: List[Dict]) -> None:
+        """모든 뉴스에 규칙 기반 요약 적용"""
+        logger.info(f"📝 AI 요약 비활성화 - 규칙 기반 요약 적용 중...")
         for news in processed_news:
-            summary_type = news.get('summary_type', 'unknown')
-            summary_stats[summary_type] = summary_stats.get(summary_type, 0) + 1
-        
-        logger.info(f"📊 요약 생성 통계: {dict(summary_stats)}")
-        logger.info(f"✅ 총 {len(processed_news)}개 뉴스 처리 완료")
-        
-        return processed_news
+            news['summary'] = self._generate_fallback_summary(news.get('title', ''), news.get('description', ''))
+            news['summary_type'] = 'rule_based'
 
     def _generate_fallback_summary(self, title: str, description: str) -> str:
         """개선된 규칙 기반 요약 생성"""
@@ -207,7 +327,8 @@ class AdvancedClassifier:
         artist_name = title.split()[0] if title else "음악 아티스트"
         
         # 키워드 기반 구체적 요약
-        if any(word in title_lower for word in ['announces', 'reveals', 'unveils']):
+        trigger = self._find_summary_trigger(title_lower)
+        if trigger == 'announce':
             if 'album' in title_lower:
                 return f"{artist_name}가 새 앨범 발매 소식을 공개했다. 팬들과 업계의 큰 관심을 받고 있다."
             elif 'tour' in title_lower:
@@ -215,7 +336,7 @@ class AdvancedClassifier:
             else:
                 return f"{artist_name}가 중요한 음악 관련 발표를 했다. 이번 소식은 팬들의 주목을 받고 있다."
         
-        elif any(word in title_lower for word in ['releases', 'drops', 'premieres']):
+        elif trigger == 'release':
             if 'single' in title_lower:
                 return f"{artist_name}가 새로운 싱글을 발표했다. 새 곡은 음악적 진화를 보여주는 작품으로 평가받는다."
             elif 'album' in title_lower:
@@ -223,13 +344,13 @@ class AdvancedClassifier:
             else:
                 return f"{artist_name}가 새로운 음악을 공개했다. 팬들과 비평가들의 긍정적 반응을 얻고 있다."
         
-        elif any(word in title_lower for word in ['tour', 'concert', 'live']):
+        elif trigger == 'live':
             return f"{artist_name}의 라이브 공연 관련 소식이 전해졌다. 콘서트 티켓과 일정 정보가 업데이트되었다."
         
-        elif any(word in title_lower for word in ['chart', 'number', 'top']):
+        elif trigger == 'chart':
             return f"{artist_name}가 음악 차트에서 주목할 만한 성과를 기록했다. 상업적 성공을 입증하는 결과다."
         
-        elif any(word in title_lower for word in ['collaboration', 'featuring', 'feat']):
+        elif trigger == 'collaboration':
             return f"{artist_name}의 새로운 협업 프로젝트 소식이 공개되었다. 음악 팬들의 기대감이 높아지고 있다."
         
         else:
@@ -237,6 +358,15 @@ class AdvancedClassifier:
             return f"{artist_name}와 관련된 주요 음악 업계 소식이 전해졌다. {title[:60]}{'...' if len(title) > 60 else ''}"
 
 
+    def _find_summary_trigger(self, title_lower: str) -> Optional[str]:
+        """요약 템플릿 종류 결정 - 우선순위대로 처음 매칭되는 키워드 그룹 (없으면 None)"""
+        for trigger, keywords in self._summary_triggers:
+            for keyword in keywords:
+                if keyword in title_lower:
+                    return trigger
+        return None
+
+
 # 테스트 코드
 if __name__ == "__main__":
     sample_news = [
@@ -8,16 +8,55 @@ import feedparser
 import requests
 import re
 import time
+import heapq
 import hashlib
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse, parse_qs
-from typing import List, Dict, Set, Tuple
+from collections import Counter
+from typing import List, Dict, FrozenSet, Set, Tuple
 import logging
 
+from keyword_matcher import KeywordMatcher
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 기사마다 쓰이는 정규식 (모듈 로드 시 한 번만 컴파일)
+_TRAILING_SLASH_RE = re.compile(r'/+$')
+_REPEATED_SLASH_RE = re.compile(r'/+')
+# 특수문자와 공백이 이어진 구간 (따옴표 제외) -> 공백 하나로 한 번에 정리
+_TITLE_SEPARATOR_RE = re.compile(r'[^\w\'\"]+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_CAPITALIZED_PHRASE_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+
+# 내용 해시에서 제외할 불용어 (해시 조회로 확인)
+_HASH_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'from', 'new', 'has'})
+
+# 중복 뉴스 선택 시 소스 신뢰도 (목록에 없는 소스는 1)
+_SOURCE_PRIORITY = {
+    'billboard.com': 10,
+    'rollingstone.com': 9,
+    'pitchfork.com': 8,
+    'variety.com': 7,
+    'musicbusinessworldwide.com': 6,
+    'consequence.net': 5,
+    'nme.com': 4,
+    'stereogum.com': 3
+}
+
+# 제목 정규화 시 제거할 일반적인 접두사/접미사
+# 나열 순서대로 하나씩 제거하던 동작과 같도록 순서를 유지한 선택 그룹 하나로 결합
+_TITLE_PREFIXES = (
+    'exclusive', 'breaking', 'watch', 'listen', 'new', 'stream',
+    'premiere', 'first look', 'video', 'audio', 'live', 'official'
+)
+_TITLE_SUFFIXES = ('watch', 'listen', 'video', 'audio', 'stream')
+_TITLE_PREFIX_RE = re.compile('^' + ''.join(f'(?:{prefix}\\s+)?' for prefix in _TITLE_PREFIXES))
+# 접미사는 끝에서부터 제거되므로 본문에서는 역순으로 나타남
+_TITLE_SUFFIX_RE = re.compile(''.join(f'(?:\\s+{suffix})?' for suffix in reversed(_TITLE_SUFFIXES)) + '$')
+
 class AdvancedNewsCollector:
     def __init__(self):
         # 음악 업계 RSS 피드 목록
@@ -50,14 +89,31 @@ class AdvancedNewsCollector:
         self.title_cache = set()
         self.content_hashes = set()
         
+        # 기사별 정규화/키워드 결과 캐시 (중복 검사에서 같은 기사를 여러 번 비교하므로)
+        self._normalized_url_cache = {}
+        self._normalized_title_cache = {}
+        self._core_keywords_cache = {}
+        self._content_hash_cache = {}
+        
         # 인기 아티스트별 더 엄격한 중복 검사
         self.popular_artists = [
             'taylor swift', 'bts', 'blackpink', 'drake', 'ariana grande', 
             'billie eilish', 'dua lipa', 'olivia rodrigo', 'travis scott', 'kendrick lamar'
         ]
+        
+        # 인기 아티스트명을 정규식 하나로 컴파일 (기사당 본문 한 번 스캔, 결과 캐시)
+        self._popular_artist_matcher = KeywordMatcher(self.popular_artists)
+        self._popular_artists_cache = {}
     
     def normalize_url(self, url: str) -> str:
-        """URL 정규화 - 개선된 버전"""
+        """URL 정규화 - 개선된 버전 (결과 캐시)"""
+        normalized = self._normalized_url_cache.get(url)
+        if normalized is None:
+            normalized = self._normalized_url_cache[url] = self._normalize_url(url)
+        return normalized
+    
+    def _normalize_url(self, url: str) -> str:
+        """URL 정규화 실제 처리"""
         try:
             parsed = urlparse(url.lower())
             
@@ -75,8 +131,8 @@ class AdvancedNewsCollector:
             normalized = f"{parsed.netloc}{parsed.path}"
             
             # 슬래시 정리
-            normalized = re.sub(r'/+$', '', normalized)  # 끝의 슬래시 제거
-            normalized = re.sub(r'/+', '/', normalized)  # 연속 슬래시 정리
+            normalized = _TRAILING_SLASH_RE.sub('', normalized)  # 끝의 슬래시 제거
+            normalized = _REPEATED_SLASH_RE.sub('/', normalized)  # 연속 슬래시 정리
             
             return normalized
             
@@ -85,50 +141,51 @@ class AdvancedNewsCollector:
             return url.lower()
     
     def normalize_title(self, title: str) -> str:
-        """제목 정규화 - 개선된 버전"""
+        """제목 정규화 - 개선된 버전 (결과 캐시)"""
+        normalized = self._normalized_title_cache.get(title)
+        if normalized is None:
+            normalized = self._normalized_title_cache[title] = self._normalize_title(title)
+        return normalized
+    
+    def _normalize_title(self, title: str) -> str:
+        """제목 정규화 실제 처리"""
         # 소문자 변환
         normalized = title.lower().strip()
         
-        # 특수문자 정리 (따옴표는 보존)
-        normalized = re.sub(r'[^\w\s\'\"''""]', ' ', normalized)
-        
-        # 연속된 공백을 하나로
-        normalized = re.sub(r'\s+', ' ', normalized)
+        # 특수문자 정리 (따옴표는 보존)와 연속된 공백 정리를 정규식 한 번으로 처리
+        normalized = _TITLE_SEPARATOR_RE.sub(' ', normalized)
         
         # 일반적인 접두사 제거 (더 포괄적으로)
-        prefixes_to_remove = [
-            'exclusive', 'breaking', 'watch', 'listen', 'new', 'stream',
-            'premiere', 'first look', 'video', 'audio', 'live', 'official'
-        ]
+        normalized = _TITLE_PREFIX_RE.sub('', normalized, count=1)
         
-        for prefix in prefixes_to_remove:
-            pattern = f'^{prefix}\\s+'
-            normalized = re.sub(pattern, '', normalized)
-        
-        # 끝의 불필요한 단어들 제거
-        suffixes_to_remove = ['watch', 'listen', 'video', 'audio', 'stream']
-        for suffix in suffixes_to_remove:
-            pattern = f'\\s+{suffix}$'
-            normalized = re.sub(pattern, '', normalized)
+        # 끝의 불필요한 단어들 제거 (해당 단어로 끝날 때만 정규식 실행)
+        if normalized.endswith(_TITLE_SUFFIXES):
+            normalized = _TITLE_SUFFIX_RE.sub('', normalized, count=1)
         
         return normalized.strip()
     
-    def extract_core_keywords(self, title: str, description: str) -> Set[str]:
-        """핵심 키워드 추출 - 새로운 메소드"""
-        text = f"{title} {description}".lower()
+    def extract_core_keywords(self, title: str, description: str) -> FrozenSet[str]:
+        """핵심 키워드 추출 - 새로운 메소드 (결과 캐시, 변경 불가 집합 반환)"""
+        key = (title, description)
+        keywords = self._core_keywords_cache.get(key)
+        if keywords is None:
+            keywords = self._core_keywords_cache[key] = self._extract_core_keywords(title, description)
+        return keywords
+    
+    def _extract_core_keywords(self, title: str, description: str) -> FrozenSet[str]:
+        """핵심 키워드 추출 실제 처리"""
+        raw_text = f"{title} {description}"
+        text = raw_text.lower()
         
         # 아티스트명 추출
-        artist_names = set()
-        for artist in self.popular_artists:
-            if artist in text:
-                artist_names.add(artist)
+        artist_names = set(self._popular_artist_matcher.find_all(text))
         
         # 다른 잠재적 아티스트명 추출 (대문자로 시작하는 단어들)
-        artist_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-        matches = re.findall(artist_pattern, f"{title} {description}")
-        for match in matches:
-            if len(match.split()) <= 3 and len(match) > 2:  # 3단어 이하, 2글자 이상
-                artist_names.add(match.lower())
+        # 대문자가 하나도 없으면 정규식 스캔 생략 (str.islower는 C 수준 검사)
+        if not raw_text.islower():
+            for match in _CAPITALIZED_PHRASE_RE.findall(raw_text):
+                if len(match.split()) <= 3 and len(match) > 2:  # 3단어 이하, 2글자 이상
+                    artist_names.add(match.lower())
         
         # 핵심 행동 키워드
         action_keywords = set()
@@ -144,25 +201,35 @@ class AdvancedNewsCollector:
             if term in text:
                 music_keywords.add(term)
         
-        return artist_names | action_keywords | music_keywords
+        return frozenset(artist_names | action_keywords | music_keywords)
     
     def generate_content_hash(self, title: str, description: str) -> str:
-        """내용 기반 해시 생성 - 개선된 버전"""
+        """내용 기반 해시 생성 - 개선된 버전 (결과 캐시)"""
+        key = (title, description)
+        content_hash = self._content_hash_cache.get(key)
+        if content_hash is None:
+            content_hash = self._content_hash_cache[key] = self._generate_content_hash(title, description)
+        return content_hash
+    
+    def _generate_content_hash(self, title: str, description: str) -> str:
+        """내용 기반 해시 생성 실제 처리"""
         # 핵심 키워드 추출
         core_keywords = self.extract_core_keywords(title, description)
         
-        # 제목에서 핵심 단어들만 추출
-        title_words = set(self.normalize_title(title).split())
-        desc_words = set(re.sub(r'[^\w\s]', '', description.lower()).split())
+        # 제목, 내용 순으로 단어 추출 (등장 순서를 유지하며 중복 제거)
+        title_words = self.normalize_title(title).split()
+        desc_words = _PUNCTUATION_RE.sub('', description.lower()).split()
         
-        # 길이가 3글자 이상인 의미있는 단어들만 선택
+        # 길이가 3글자 이상인 의미있는 단어들을 앞에서부터 최대 10개 선택
         meaningful_words = []
-        for word in (title_words | desc_words):
-            if len(word) >= 3 and word not in ['the', 'and', 'for', 'with', 'from', 'new', 'has']:
+        for word in dict.fromkeys(title_words + desc_words):
+            if len(word) >= 3 and word not in _HASH_STOPWORDS:
                 meaningful_words.append(word)
+                if len(meaningful_words) == 10:
+                    break
         
         # 핵심 키워드와 의미있는 단어들을 합쳐서 해시 생성
-        all_keywords = core_keywords | set(meaningful_words[:10])
+        all_keywords = core_keywords.union(meaningful_words)
         content = ' '.join(sorted(all_keywords))
         
         return hashlib.md5(content.encode()).hexdigest()
@@ -197,22 +264,35 @@ class AdvancedNewsCollector:
         
         return final_similarity
     
+    def find_popular_artists(self, title: str, description: str) -> FrozenSet[str]:
+        """제목+내용에 등장하는 인기 아티스트 집합 (결과 캐시)"""
+        key = (title, description)
+        artists = self._popular_artists_cache.get(key)
+        if artists is None:
+            artists = self._popular_artists_cache[key] = frozenset(
+                self._popular_artist_matcher.find_all(f"{title} {description}".lower())
+            )
+        return artists
+    
     def check_popular_artist_duplicate(self, news1: Dict, news2: Dict) -> bool:
         """인기 아티스트에 대한 더 엄격한 중복 검사"""
-        text1 = f"{news1.get('title', '')} {news1.get('description', '')}".lower()
-        text2 = f"{news2.get('title', '')} {news2.get('description', '')}".lower()
+        artists1 = self.find_popular_artists(news1.get('title', ''), news1.get('description', ''))
+        artists2 = self.find_popular_artists(news2.get('title', ''), news2.get('description', ''))
         
         # 같은 인기 아티스트가 포함된 경우
-        for artist in self.popular_artists:
-            if artist in text1 and artist in text2:
-                # 제목 유사도가 60% 이상이면 중복으로 판단
-                similarity = self.calculate_title_similarity(
-                    news1.get('title', ''), 
-                    news2.get('title', '')
-                )
-                if similarity >= 0.6:  # 인기 아티스트는 더 엄격하게
-                    logger.debug(f"인기 아티스트 '{artist}' 중복 발견: {similarity:.2f}")
-                    return True
+        common_artists = artists1 & artists2
+        if not common_artists:
+            return False
+        
+        # 제목 유사도가 60% 이상이면 중복으로 판단 (아티스트와 무관하므로 한 번만 계산)
+        similarity = self.calculate_title_similarity(
+            news1.get('title', ''), 
+            news2.get('title', '')
+        )
+        if similarity >= 0.6:  # 인기 아티스트는 더 엄격하게
+            artist = next(artist for artist in self.popular_artists if artist in common_artists)
+            logger.debug("인기 아티스트 '%s' 중복 발견: %.2f", artist, similarity)
+            return True
         
         return False
     
@@ -224,7 +304,7 @@ class AdvancedNewsCollector:
         url2 = self.normalize_url(news2.get('link', ''))
         
         if url1 and url2 and url1 == url2:
-            logger.debug(f"URL 중복 발견: {url1}")
+            logger.debug("URL 중복 발견: %s", url1)
             return True
         
         # 2. 인기 아티스트에 대한 특별 검사
@@ -239,7 +319,7 @@ class AdvancedNewsCollector:
         
         # 제목이 80% 이상 유사하면 중복 (기존 90%에서 낮춤)
         if title_similarity >= 0.8:
-            logger.debug(f"제목 유사도 중복: {title_similarity:.2f}")
+            logger.debug("제목 유사도 중복: %.2f", title_similarity)
             return True
         
         # 4. 내용 해시 기반 검사
@@ -247,7 +327,7 @@ class AdvancedNewsCollector:
         hash2 = self.generate_content_hash(title2, news2.get('description', ''))
         
         if hash1 == hash2:
-            logger.debug(f"내용 해시 중복: {hash1}")
+            logger.debug("내용 해시 중복: %s", hash1)
             return True
         
         # 5. 핵심 키워드 중복도가 높은 경우
@@ -264,7 +344,7 @@ class AdvancedNewsCollector:
                     combined_score = (title_similarity * 0.6) + (keyword_similarity * 0.4)
                     
                     if combined_score >= 0.75:  # 종합 점수 75% 이상이면 중복
-                        logger.debug(f"키워드+제목 종합 중복: {combined_score:.2f}")
+                        logger.debug("키워드+제목 종합 중복: %.2f", combined_score)
                         return True
         
         # 6. 같은 소스에서 같은 시간대의 유사한 뉴스
@@ -282,7 +362,7 @@ class AdvancedNewsCollector:
                     time_diff = abs((dt1 - dt2).total_seconds())
                     
                     if time_diff <= 7200:  # 2시간 (기존 1시간에서 확장)
-                        logger.debug(f"시간+소스 기반 중복")
+                        logger.debug("시간+소스 기반 중복")
                         return True
                         
                 except ValueError:
@@ -312,7 +392,7 @@ class AdvancedNewsCollector:
             if normalized_url in url_cache:
                 is_duplicate = True
                 removed_count += 1
-                logger.debug(f"URL 캐시 중복 제거: {news.get('title', '')[:50]}...")
+                logger.debug("URL 캐시 중복 제거: %.50s...", news.get('title', ''))
             else:
                 url_cache.add(normalized_url)
                 
@@ -328,9 +408,9 @@ class AdvancedNewsCollector:
                         if should_replace:
                             unique_news.remove(existing_news)
                             unique_news.append(news)
-                            logger.debug(f"더 나은 뉴스로 교체: {news.get('title', '')[:50]}...")
+                            logger.debug("더 나은 뉴스로 교체: %.50s...", news.get('title', ''))
                         else:
-                            logger.debug(f"중복 제거: {news.get('title', '')[:50]}...")
+                            logger.debug("중복 제거: %.50s...", news.get('title', ''))
                         
                         break
             
@@ -355,19 +435,8 @@ class AdvancedNewsCollector:
         """두 중복 뉴스 중 어느 것을 선택할지 결정 - 개선된 버전"""
         
         # 1. 소스 신뢰도 비교 (가중치 증가)
-        source_priority = {
-            'billboard.com': 10,
-            'rollingstone.com': 9,
-            'pitchfork.com': 8,
-            'variety.com': 7,
-            'musicbusinessworldwide.com': 6,
-            'consequence.net': 5,
-            'nme.com': 4,
-            'stereogum.com': 3
-        }
-        
-        existing_priority = source_priority.get(existing.get('source', ''), 1)
-        new_priority = source_priority.get(new.get('source', ''), 1)
+        existing_priority = _SOURCE_PRIORITY.get(existing.get('source', ''), 1)
+        new_priority = _SOURCE_PRIORITY.get(new.get('source', ''), 1)
         
         # 소스 우선순위 차이가 2 이상이면 결정적
         if new_priority - existing_priority >= 2:
@@ -415,23 +484,23 @@ class AdvancedNewsCollector:
                 if artist in title:
                     artist_duplicates[artist] = artist_duplicates.get(artist, 0) + 1
         
-        # 중복이 많은 아티스트들 출력
-        high_duplicate_artists = [(artist, count) for artist, count in artist_duplicates.items() if count > 1]
-        high_duplicate_artists.sort(key=lambda x: x[1], reverse=True)
+        # 중복이 많은 아티스트들 출력 (전체 정렬 없이 상위 5개만 선택)
+        high_duplicate_artists = heapq.nlargest(
+            5,
+            [(artist, count) for artist, count in artist_duplicates.items() if count > 1],
+            key=lambda x: x[1]
+        )
         
         if high_duplicate_artists:
             logger.info("아티스트별 중복 뉴스:")
-            for artist, count in high_duplicate_artists[:5]:
+            for artist, count in high_duplicate_artists:
                 logger.info(f"  {artist.title()}: {count}개")
         
         # 소스별 중복 통계
-        source_counts = {}
-        for news in original_list:
-            source = news.get('source', '')
-            source_counts[source] = source_counts.get(source, 0) + 1
+        source_counts = Counter(news.get('source', '') for news in original_list)
         
         logger.info("소스별 뉴스 수:")
-        for source, count in sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for source, count in source_counts.most_common(5):
             logger.info(f"  {source}: {count}개")
     
     def fetch_rss_feed(self, url: str) -> List[Dict]:
@@ -473,9 +542,8 @@ class AdvancedNewsCollector:
                     if not title or not description:
                         continue
                     
-                    # HTML 태그 제거
-                    description = re.sub(r'<[^>]+>', '', description)
-                    description = re.sub(r'\s+', ' ', description).strip()
+                    # HTML 태그 제거 후 공백 정리 (split/join으로 정리와 strip을 한 번에)
+                    description = ' '.join(_HTML_TAG_RE.sub('', description).split())
                     
                     # 음악 관련성 검사
                     relevance = self.calculate_music_relevance(title, description)
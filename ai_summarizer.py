@@ -5,18 +5,51 @@ AI 요약 시스템 (Claude API 연동) - 개선된 5W1H 한국어 요약
 """
 
 import os
+import re
 import time
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from anthropic import Anthropic
+from anthropic import Anthropic, APIError
 import json
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 요약 후처리용 정규식 (모듈 로드 시 한 번만 컴파일)
+_SUMMARY_PREFIX_RE = re.compile(r'^(요약|Summary|한국어 요약)\s*[:：]\s*')
+
+# 요약 품질 검증: 너무 일반적인 표현 (하나라도 포함되면 불합격)
+_GENERIC_SUMMARY_RE = re.compile('|'.join(map(re.escape, (
+    "음악 활동 소식이 업데이트되었다",
+    "최신 소식이 전해졌다",
+    "새로운 소식을 발표했다",
+    "업계 뉴스가 보도되었다",
+    "음악 업계 뉴스 업데이트입니다",
+))))
+
+# 요약 품질 검증: 5W1H 요소별 지표 단어 (요소마다 정규식 한 번으로 검사)
+_W5H1_INDICATOR_RES = {
+    'who': re.compile('가|이|는|의|밴드|아티스트|가수|뮤지션'),
+    'what': re.compile('앨범|곡|투어|콘서트|발매|공개|발표|계약'),
+    'when': re.compile('월|일|년|예정|오는|다음|이번'),
+}
+
+# 대체 요약 템플릿 (트리거 단어, 템플릿) - 우선순위 순서대로 처음 매칭되는 템플릿 사용
+_FALLBACK_TEMPLATES = (
+    (('album', 'ep'), "{artist}가 새 앨범 발매 소식을 공개했다. 이번 릴리스는 팬들과 음악 업계의 큰 관심을 받고 있다."),
+    (('single', 'song', 'track'), "{artist}가 새로운 싱글을 발표했다. 새 곡은 아티스트의 음악적 진화를 보여주는 작품으로 평가받고 있다."),
+    (('tour', 'concert', 'live'), "{artist}가 새로운 투어 일정을 발표했다. 콘서트 관련 상세 정보는 공식 채널을 통해 확인할 수 있다."),
+    (('chart', 'number', 'top'), "{artist}가 음악 차트에서 주목할 만한 성과를 기록했다. 이번 차트 진입은 아티스트의 상업적 성공을 입증한다."),
+    (('deal', 'sign', 'contract'), "{artist}가 새로운 음악 계약을 체결했다고 발표되었다. 이번 파트너십은 아티스트의 향후 활동에 긍정적 영향을 미칠 전망이다."),
+    (('announces', 'reveals', 'drops'), "{artist}가 중요한 음악 관련 발표를 했다. 이번 소식은 팬들과 업계 관계자들의 주목을 받고 있다."),
+)
+
 class AISummarizer:
-    def __init__(self):
+    def __init__(self, cache_file: str = ".cache/ai_summaries.json"):
         """AI 요약기 초기화"""
         self.api_key = os.environ.get('ANTHROPIC_API_KEY')
         if not self.api_key:
@@ -25,6 +58,14 @@ class AISummarizer:
         self.client = Anthropic(api_key=self.api_key)
         self.request_count = 0
         self.max_requests_per_minute = 50  # API 레이트 리미트
+        self.max_concurrent_requests = 5  # 동시 요청 수 (네트워크 대기 시간 중첩)
+        self._rate_limit_lock = threading.Lock()
+        
+        # AI 요약 캐시 (제목+내용 해시 -> 요약, 실행 간 재사용으로 같은 기사 재요청 방지)
+        self.cache_file = cache_file
+        self.max_cache_entries = 2000  # 초과 시 오래된 항목부터 제거
+        self._summary_cache = self._load_summary_cache()
+        self._cache_lock = threading.Lock()
         
         # 개선된 5W1H 한국어 요약 프롬프트 템플릿
         self.prompt_template = """
@@ -71,20 +112,53 @@ class AISummarizer:
         Returns:
             생성된 5W1H 기반 한국어 요약 텍스트
         """
+        # 제목과 내용이 모두 없으면 API를 호출하지 않음
+        if not title and not description:
+            return self._generate_fallback_summary(title, description)
+        
+        # 이전 실행에서 만든 요약이 있으면 API 호출 생략
+        cache_key = self._cache_key(title, description)
+        cached_summary = self._summary_cache.get(cache_key)
+        if cached_summary:
+            logger.info("캐시된 AI 한글 요약 사용: %.50s...", title)
+            return cached_summary
+        
+        # 레이트 리미트 체크
+        self._check_rate_limit()
+        
+        # 프롬프트 생성
+        prompt = self.prompt_template.format(
+            title=title,
+            description=description[:800],  # 토큰 제한
+            url=url
+        )
+        
+        logger.info("AI 한글 요약 요청: %.50s...", title)
+        
+        # Claude API 호출 (실패 시 None)
+        summary = self._request_summary(prompt)
+        if summary is None:
+            # 오류 시 개선된 대체 요약 반환
+            return self._generate_fallback_summary(title, description)
+        
+        # 요약 후처리
+        summary = self._post_process_summary(summary)
+        
+        # 품질 검증
+        if self._validate_summary_quality(summary, title):
+            logger.info("AI 한글 요약 완료: %d 문자", len(summary))
+            with self._rate_limit_lock:
+                self.request_count += 1
+            with self._cache_lock:
+                self._summary_cache[cache_key] = summary
+            return summary
+        else:
+            logger.warning("생성된 요약이 품질 기준 미달. 대체 요약 생성.")
+            return self._generate_fallback_summary(title, description)
+    
+    def _request_summary(self, prompt: str) -> Optional[str]:
+        """Claude API 호출 - API 오류나 예상치 못한 응답 형식이면 None 반환"""
         try:
-            # 레이트 리미트 체크
-            self._check_rate_limit()
-            
-            # 프롬프트 생성
-            prompt = self.prompt_template.format(
-                title=title,
-                description=description[:800],  # 토큰 제한
-                url=url
-            )
-            
-            logger.info(f"AI 한글 요약 요청: {title[:50]}...")
-            
-            # Claude API 호출
             response = self.client.messages.create(
                 model="claude-3-haiku-20240307",  # 빠르고 경제적인 모델
                 max_tokens=400,  # 한국어 요약을 위해 증가
@@ -96,24 +170,11 @@ class AISummarizer:
             )
             
             # 응답 처리
-            summary = response.content[0].text.strip()
+            return response.content[0].text.strip()
             
-            # 요약 후처리
-            summary = self._post_process_summary(summary)
-            
-            # 품질 검증
-            if self._validate_summary_quality(summary, title):
-                logger.info(f"AI 한글 요약 완료: {len(summary)} 문자")
-                self.request_count += 1
-                return summary
-            else:
-                logger.warning("생성된 요약이 품질 기준 미달. 대체 요약 생성.")
-                return self._generate_fallback_summary(title, description)
-            
-        except Exception as e:
+        except (APIError, IndexError, AttributeError) as e:
             logger.error(f"AI 요약 생성 오류: {e}")
-            # 오류 시 개선된 대체 요약 반환
-            return self._generate_fallback_summary(title, description)
+            return None
     
     def batch_summarize(self, news_list: List[Dict], max_items: int = 10) -> List[Dict]:
         """
@@ -128,8 +189,6 @@ class AISummarizer:
         """
         logger.info(f"배치 AI 한글 요약 시작: {len(news_list)} 개 중 상위 {max_items}개 처리")
         
-        processed_news = []
-        
         # 중요도 순으로 정렬
         sorted_news = sorted(
             news_list, 
@@ -137,63 +196,109 @@ class AISummarizer:
             reverse=True
         )
         
-        for i, news in enumerate(sorted_news):
-            try:
-                # 최대 처리 개수 제한
-                if i >= max_items:
-                    # 나머지는 대체 요약 사용
-                    fallback_summary = self._generate_fallback_summary(
-                        news.get('title', ''),
-                        news.get('description', '')
-                    )
-                    processed_news.append({
-                        **news,
-                        'summary': fallback_summary,
-                        'summary_type': 'rule_based'
-                    })
-                    continue
-                
-                # AI 한글 요약 생성
-                ai_summary = self.generate_summary(
-                    title=news.get('title', ''),
-                    description=news.get('description', ''),
-                    url=news.get('url', '')
-                )
-                
-                # 뉴스 항목 업데이트
-                updated_news = {
-                    **news,
-                    'summary': ai_summary,
-                    'summary_type': 'ai_generated'
-                }
-                
-                processed_news.append(updated_news)
-                
-                # API 레이트 리미트 준수
-                time.sleep(0.1)  # 요청 간격 조절
-                
-            except Exception as e:
-                logger.error(f"뉴스 처리 오류: {e} - {news.get('title', '')}")
-                # 오류 시 대체 요약 사용
-                fallback_summary = self._generate_fallback_summary(
-                    news.get('title', ''),
-                    news.get('description', '')
-                )
-                processed_news.append({
-                    **news,
-                    'summary': fallback_summary,
-                    'summary_type': 'rule_based'
-                })
+        ai_targets = sorted_news[:max_items]
+        processed_news = []
+        
+        # AI 한글 요약 생성 (요청 시간 대부분이 네트워크 대기이므로 동시에 처리)
+        if ai_targets:
+            max_workers = min(self.max_concurrent_requests, len(ai_targets))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                processed_news.extend(executor.map(self._summarize_news_item, ai_targets))
+        
+        # 최대 처리 개수를 넘는 나머지는 대체 요약 사용
+        for news in sorted_news[max_items:]:
+            fallback_summary = self._generate_fallback_summary(
+                news.get('title', ''),
+                news.get('description', '')
+            )
+            processed_news.append({
+                **news,
+                'summary': fallback_summary,
+                'summary_type': 'rule_based'
+            })
         
         logger.info(f"배치 AI 한글 요약 완료: {min(max_items, len(news_list))}개 처리됨")
+        
+        # 새로 만든 요약을 다음 실행에서 재사용할 수 있도록 저장
+        self.save_summary_cache()
         return processed_news
     
+    def _summarize_news_item(self, news: Dict) -> Dict:
+        """단일 뉴스 AI 요약 (배치 작업자 스레드에서 실행)"""
+        try:
+            ai_summary = self.generate_summary(
+                title=news.get('title', ''),
+                description=news.get('description', ''),
+                url=news.get('url', '')
+            )
+            
+            return {
+                **news,
+                'summary': ai_summary,
+                'summary_type': 'ai_generated'
+            }
+            
+        except Exception as e:
+            logger.error(f"뉴스 처리 오류: {e} - {news.get('title', '')}")
+            # 오류 시 대체 요약 사용
+            fallback_summary = self._generate_fallback_summary(
+                news.get('title', ''),
+                news.get('description', '')
+            )
+            return {
+                **news,
+                'summary': fallback_summary,
+                'summary_type': 'rule_based'
+            }
+    
+    @staticmethod
+    def _cache_key(title: str, description: str) -> str:
+        """요약 캐시 키 (제목+내용 해시)"""
+        return hashlib.sha1(f"{title}\n{description}".encode('utf-8')).hexdigest()
+    
+    def _load_summary_cache(self) -> Dict[str, str]:
+        """요약 캐시 파일 로드 (없거나 손상된 경우 빈 캐시)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                logger.info(f"💾 AI 요약 캐시 로드: {len(cache)}개")
+                return cache
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ AI 요약 캐시 로드 실패: {e}")
+        return {}
+    
+    def save_summary_cache(self):
+        """요약 캐시 파일 저장 (최근 항목 max_cache_entries개 유지)"""
+        with self._cache_lock:
+            # dict는 삽입 순서를 유지하므로 앞쪽(오래된) 항목부터 제거
+            overflow = len(self._summary_cache) - self.max_cache_entries
+            for key in list(self._summary_cache)[:max(overflow, 0)]:
+                del self._summary_cache[key]
+            cache = dict(self._summary_cache)
+        
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            
+            # 임시 파일에 쓴 뒤 교체 (저장 중 실패해도 기존 캐시 보존)
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"⚠️ AI 요약 캐시 저장 실패: {e}")
+    
     def _check_rate_limit(self):
-        """API 레이트 리미트 체크"""
-        if self.request_count >= self.max_requests_per_minute:
-            logger.warning("API 레이트 리미트 도달, 1분 대기...")
-            time.sleep(60)
-            self.request_count = 0
+        """API 레이트 리미트 체크 (동시 요청 간 공유)"""
+        with self._rate_limit_lock:
+            if self.request_count >= self.max_requests_per_minute:
+                logger.warning("API 레이트 리미트 도달, 1분 대기...")
+                time.sleep(60)
+                self.request_count = 0
     
     def _post_process_summary(self, summary: str) -> str:
         """요약 후처리 - 품질 검증 강화"""
@@ -204,8 +309,7 @@ class AISummarizer:
         summary = summary.strip()
         
         # 프롬프트 잔재 제거
-        import re
-        summary = re.sub(r'^(요약|Summary|한국어 요약)\s*[:：]\s*', '', summary)
+        summary = _SUMMARY_PREFIX_RE.sub('', summary)
         summary = summary.strip('"\'""''')
         
         # 문장 끝 정리
@@ -216,13 +320,15 @@ class AISummarizer:
         if len(summary) > 200:
             sentences = summary.split('.')
             if len(sentences) > 1:
-                truncated = sentences[0]
+                # 197자를 넘기 전까지의 문장만 남기고 마지막에 한 번만 합침
+                kept = [sentences[0]]
+                length = len(sentences[0])
                 for sentence in sentences[1:]:
-                    if len(truncated + '. ' + sentence) <= 197:
-                        truncated += '. ' + sentence
-                    else:
+                    length += len(sentence) + 2  # '. ' 구분자 포함
+                    if length > 197:
                         break
-                summary = truncated.rstrip('.') + '.'
+                    kept.append(sentence)
+                summary = '. '.join(kept).rstrip('.') + '.'
             else:
                 summary = summary[:197] + '...'
         
@@ -234,26 +340,11 @@ class AISummarizer:
             return False
         
         # 너무 일반적인 표현 금지
-        generic_phrases = [
-            "음악 활동 소식이 업데이트되었다",
-            "최신 소식이 전해졌다", 
-            "새로운 소식을 발표했다",
-            "업계 뉴스가 보도되었다",
-            "음악 업계 뉴스 업데이트입니다"
-        ]
-        
-        for phrase in generic_phrases:
-            if phrase in summary:
-                return False
+        if _GENERIC_SUMMARY_RE.search(summary):
+            return False
         
         # 5W1H 중 최소 2개 요소가 포함되어야 함
-        w5h1_indicators = {
-            'who': any(indicator in summary for indicator in ['가', '이', '는', '의', '밴드', '아티스트', '가수', '뮤지션']),
-            'what': any(indicator in summary for indicator in ['앨범', '곡', '투어', '콘서트', '발매', '공개', '발표', '계약']),
-            'when': any(indicator in summary for indicator in ['월', '일', '년', '예정', '오는', '다음', '이번']),
-        }
-        
-        valid_elements = sum(w5h1_indicators.values())
+        valid_elements = sum(1 for pattern in _W5H1_INDICATOR_RES.values() if pattern.search(summary))
         return valid_elements >= 2  # 최소 2개 요소 필요
     
     def _generate_fallback_summary(self, title: str, description: str) -> str:
@@ -264,27 +355,17 @@ class AISummarizer:
         # 아티스트명 추출 시도
         artist_name = self._extract_artist_name(title)
         
-        # 활동 유형별 개선된 템플릿
-        if any(word in title_lower for word in ['album', 'ep']):
-            return f"{artist_name}가 새 앨범 발매 소식을 공개했다. 이번 릴리스는 팬들과 음악 업계의 큰 관심을 받고 있다."
-        elif any(word in title_lower for word in ['single', 'song', 'track']):
-            return f"{artist_name}가 새로운 싱글을 발표했다. 새 곡은 아티스트의 음악적 진화를 보여주는 작품으로 평가받고 있다."
-        elif any(word in title_lower for word in ['tour', 'concert', 'live']):
-            return f"{artist_name}가 새로운 투어 일정을 발표했다. 콘서트 관련 상세 정보는 공식 채널을 통해 확인할 수 있다."
-        elif any(word in title_lower for word in ['chart', 'number', 'top']):
-            return f"{artist_name}가 음악 차트에서 주목할 만한 성과를 기록했다. 이번 차트 진입은 아티스트의 상업적 성공을 입증한다."
-        elif any(word in title_lower for word in ['deal', 'sign', 'contract']):
-            return f"{artist_name}가 새로운 음악 계약을 체결했다고 발표되었다. 이번 파트너십은 아티스트의 향후 활동에 긍정적 영향을 미칠 전망이다."
-        elif any(word in title_lower for word in ['announces', 'reveals', 'drops']):
-            return f"{artist_name}가 중요한 음악 관련 발표를 했다. 이번 소식은 팬들과 업계 관계자들의 주목을 받고 있다."
-        else:
-            return f"{artist_name}와 관련된 주요 음악 업계 소식이 전해졌다. {title[:60]}{'...' if len(title) > 60 else ''}"
+        # 활동 유형별 개선된 템플릿 (트리거 테이블을 순서대로 확인해 처음 매칭되는 템플릿 사용)
+        for triggers, template in _FALLBACK_TEMPLATES:
+            for word in triggers:
+                if word in title_lower:
+                    return template.format(artist=artist_name)
+        
+        return f"{artist_name}와 관련된 주요 음악 업계 소식이 전해졌다. {title[:60]}{'...' if len(title) > 60 else ''}"
     
     def _extract_artist_name(self, title: str) -> str:
         """제목에서 아티스트명 추출 시도"""
         # 간단한 아티스트명 추출 로직
-        import re
-        
         # 첫 번째 단어나 구문이 아티스트일 가능성이 높음
         words = title.split()
         if words:
@@ -292,7 +373,8 @@ class AISummarizer:
             if len(words) >= 2:
                 potential_artist = ' '.join(words[:2])
                 # 일반적인 동사들이 포함되면 첫 단어만
-                if any(verb in potential_artist.lower() for verb in ['announces', 'reveals', 'drops', 'releases', 'shares']):
+                potential_artist_lower = potential_artist.lower()
+                if any(verb in potential_artist_lower for verb in ('announces', 'reveals', 'drops', 'releases', 'shares')):
                     return words[0] if words else "음악 아티스트"
                 return potential_artist
             else:
@@ -307,6 +389,9 @@ AI_SUMMARIZER_CONFIG = {
     "max_tokens": 400,
     "temperature": 0.2,
     "max_items_per_batch": 10,
+    "max_concurrent_requests": 5,
+    "summary_cache_file": ".cache/ai_summaries.json",
+    "max_cache_entries": 2000,
     "rate_limit_per_minute": 50,
     "language": "Korean",
     "style": "5W1H Natural Korean News Style",
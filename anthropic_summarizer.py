@@ -7,6 +7,8 @@ Claude를 사용하여 자연스러운 한국어 요약 생성
 import os
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import requests
 import json
@@ -26,6 +28,16 @@ class AnthropicSummarizer:
         self.max_tokens = 200
         self.request_count = 0
         self.max_requests_per_minute = 50
+        self.max_concurrent_requests = 5  # 동시 요청 수 (네트워크 대기 시간 중첩)
+        self._rate_limit_lock = threading.Lock()
+        
+        # API 세션 (요청 간 HTTPS 연결 재사용, 공통 헤더는 한 번만 설정)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        })
         
         # 요약 프롬프트 템플릿
         self.summary_prompt = """당신은 음악 업계 뉴스 전문 에디터입니다. 주어진 뉴스를 자연스러운 한국어로 요약해주세요.
@@ -67,16 +79,9 @@ class AnthropicSummarizer:
                 ]
             }
             
-            # API 호출
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01"
-            }
-            
-            response = requests.post(
+            # API 호출 (세션 재사용)
+            response = self.session.post(
                 self.api_url,
-                headers=headers,
                 json=request_data,
                 timeout=30
             )
@@ -92,7 +97,8 @@ class AnthropicSummarizer:
                 summary = self._post_process_summary(summary)
                 
                 logger.info(f"Claude 요약 생성 완료: {len(summary)} 문자")
-                self.request_count += 1
+                with self._rate_limit_lock:
+                    self.request_count += 1
                 
                 return summary
             else:
@@ -116,50 +122,51 @@ class AnthropicSummarizer:
             reverse=True
         )
         
-        for i, news in enumerate(sorted_news):
-            try:
-                # 최대 처리 개수 제한
-                if i >= max_items:
-                    processed_news.append(news)
-                    continue
-                
-                # Claude 요약 생성
-                claude_summary = self.generate_summary(
-                    title=news.get('title', ''),
-                    description=news.get('description', ''),
-                    url=news.get('url', '')
-                )
-                
-                # 뉴스 항목 업데이트
-                updated_news = {
-                    **news,
-                    'claude_summary': claude_summary,
-                    'summary': claude_summary,  # 기본 summary 필드도 업데이트
-                    'summary_type': 'claude_generated'
-                }
-                
-                processed_news.append(updated_news)
-                
-                # API 레이트 리미트 준수 (요청 간격 조절)
-                time.sleep(1.5)  # Claude API는 더 여유롭게
-                
-            except Exception as e:
-                logger.error(f"뉴스 처리 오류: {e} - {news.get('title', '')}")
-                # 오류 시 원본 뉴스 유지
-                processed_news.append({
-                    **news,
-                    'summary_type': 'rule_based'
-                })
+        # 상위 항목은 Claude 요약 (요청 시간 대부분이 네트워크 대기이므로 동시에 처리)
+        claude_targets = sorted_news[:max_items]
+        if claude_targets:
+            max_workers = min(self.max_concurrent_requests, len(claude_targets))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                processed_news.extend(executor.map(self._summarize_news_item, claude_targets))
+        
+        # 최대 처리 개수를 넘는 나머지는 원본 유지
+        processed_news.extend(sorted_news[max_items:])
         
         logger.info(f"Claude 배치 요약 완료: {min(max_items, len(news_list))}개 처리됨")
         return processed_news
     
+    def _summarize_news_item(self, news: Dict) -> Dict:
+        """단일 뉴스 Claude 요약 (배치 작업자 스레드에서 실행)"""
+        try:
+            claude_summary = self.generate_summary(
+                title=news.get('title', ''),
+                description=news.get('description', ''),
+                url=news.get('url', '')
+            )
+            
+            # 뉴스 항목 업데이트
+            return {
+                **news,
+                'claude_summary': claude_summary,
+                'summary': claude_summary,  # 기본 summary 필드도 업데이트
+                'summary_type': 'claude_generated'
+            }
+            
+        except Exception as e:
+            logger.error(f"뉴스 처리 오류: {e} - {news.get('title', '')}")
+            # 오류 시 원본 뉴스 유지
+            return {
+                **news,
+                'summary_type': 'rule_based'
+            }
+    
     def _check_rate_limit(self):
-        """API 레이트 리미트 체크"""
-        if self.request_count >= self.max_requests_per_minute:
-            logger.warning("Claude API 레이트 리미트 도달, 1분 대기...")
-            time.sleep(60)
-            self.request_count = 0
+        """API 레이트 리미트 체크 (동시 요청 간 공유)"""
+        with self._rate_limit_lock:
+            if self.request_count >= self.max_requests_per_minute:
+                logger.warning("Claude API 레이트 리미트 도달, 1분 대기...")
+                time.sleep(60)
+                self.request_count = 0
     
     def _post_process_summary(self, summary: str) -> str:
         """Claude 요약 후처리"""
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Dict
 import logging
 from collections import Counter
+from operator import itemgetter
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -51,9 +52,9 @@ class MusicNewsJSONGenerator:
 
             all_news_articles.append(news_article)
 
-        # 날짜순으로 정렬 (최신순)
+        # 날짜순으로 정렬 (최신순, 위에서 모든 항목에 published_date 키를 채우므로 itemgetter 사용)
         all_news_articles.sort(
-            key=lambda x: x.get('published_date', ''), 
+            key=itemgetter('published_date'), 
             reverse=True
         )
 
@@ -91,19 +92,12 @@ class MusicNewsJSONGenerator:
 
     def _get_category_stats(self, articles: List[Dict]) -> Dict:
         """카테고리별 통계"""
-        categories = {}
-        for article in articles:
-            category = article.get('category', 'unknown')
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        return dict(Counter(article.get('category', 'unknown') for article in articles))
 
     def _get_source_stats(self, articles: List[Dict]) -> Dict:
         """소스별 통계 (상위 10개)"""
-        sources = {}
-        for article in articles:
-            source = article.get('source', 'unknown')
-            sources[source] = sources.get(source, 0) + 1
-        return dict(sorted(sources.items(), key=lambda x: x[1], reverse=True)[:10])
+        # 전체 정렬 없이 상위 10개만 선택 (동률은 처음 등장한 순서 유지)
+        return dict(Counter(article.get('source', 'unknown') for article in articles).most_common(10))
 
     def save_json_file(self, json_data: Dict) -> str:
         """JSON 파일 저장"""
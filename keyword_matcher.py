@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher
+여러 키워드를 한 번의 정규식 스캔으로 찾는 부분 문자열 매처
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Iterator, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    키워드 집합을 트라이 형태의 정규식 하나로 컴파일해 본문을 한 번만 스캔합니다.
+
+    결과는 키워드마다 `keyword in text`를 검사한 것과 같습니다. 각 위치에서
+    가장 긴 키워드를 찾고, 그 키워드의 접두사인 다른 키워드도 함께 매칭된 것으로
+    처리하므로 겹치는 키워드('k-pop'과 'pop', 'record'와 'record deal')도 모두 잡힙니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # 빈 문자열은 모든 위치에 매칭되므로 제외, 순서를 유지하며 중복 제거
+        self.keywords = tuple(dict.fromkeys(keyword for keyword in keywords if keyword))
+
+        # 각 위치에서 가장 긴 키워드를 잡는 zero-width lookahead (겹치는 매칭 허용)
+        self._pattern = re.compile('(?=(' + self._build_trie_pattern(self.keywords) + '))')
+
+        # 가장 긴 매칭 키워드 -> 같은 위치에서 함께 매칭되는 키워드들 (자기 자신 포함)
+        self._prefix_closure: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(other for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+
+    @staticmethod
+    def _build_trie_pattern(keywords: Iterable[str]) -> str:
+        """키워드 트라이를 중첩 alternation 정규식 문자열로 변환"""
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}  # 키워드 끝 표시
+
+        def build(node: Dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if '' in node:
+                # 여기서 끝나는 키워드가 있으면 더 긴 키워드를 우선 시도 (greedy)
+                return '(?:' + body + ')?'
+            return body
+
+        return build(trie) if keywords else '(?!)'
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(시작 위치, 키워드) 쌍을 본문 순서대로 생성"""
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefix_closure[match.group(1)]:
+                yield start, keyword
+
+    def find_all(self, text: str) -> Set[str]:
+        """본문에 등장하는 모든 키워드 집합"""
+        found: Set[str] = set()
+        for longest in set(self._pattern.findall(text)):
+            found |= self._prefix_closure[longest]
+        return found
@@ -4,8 +4,11 @@ Simplified Music News Automation System
 중복 제거 + 최신순 정렬로 단순화된 음악 뉴스 자동화 시스템
 """
 import os
+import heapq
 import argparse
 import logging
+from collections import Counter
+from operator import itemgetter
 from datetime import datetime
 from typing import List, Dict
 
@@ -64,37 +67,29 @@ def main():
         logger.info(f"✅ 총 {len(processed_news)}개 뉴스 아이템 처리 완료")
         
         # 처리 통계 출력
-        categories = {}
-        for news in processed_news:
-            category = news.get('category', 'NEWS')
-            categories[category] = categories.get(category, 0) + 1
+        categories = Counter(news.get('category', 'NEWS') for news in processed_news)
         
         logger.info(f"📊 카테고리별 분포: {dict(sorted(categories.items()))}")
         
         # 4. 최신순으로 정렬하여 상위 N개 선택
         logger.info(f"\n📅 4단계: 최신순 정렬하여 상위 {args.count}개 선택...")
         
-        # 발행 시간순으로 정렬 (최신순)
+        # 발행 시간 기준 최신 N개 선택 (전체 정렬 없이 상위 N개만)
+        # 수집기가 모든 항목에 published_date를 채우므로 C 수준 itemgetter로 키 추출
         try:
-            sorted_news = sorted(
+            selected_news = heapq.nlargest(
+                args.count,
                 processed_news, 
-                key=lambda x: x.get('published_date', ''), 
-                reverse=True
+                key=itemgetter('published_date')
             )
         except:
             # 정렬 실패 시 원본 순서 유지
-            sorted_news = processed_news
-        
-        # 상위 N개 선택
-        selected_news = sorted_news[:args.count]
+            selected_news = processed_news[:args.count]
         
         logger.info(f"✅ 최신순으로 {len(selected_news)}개 뉴스 선택 완료")
         
         # 선별된 뉴스 통계
-        selected_categories = {}
-        for news in selected_news:
-            category = news.get('category', 'NEWS')
-            selected_categories[category] = selected_categories.get(category, 0) + 1
+        selected_categories = Counter(news.get('category', 'NEWS') for news in selected_news)
         
         logger.info(f"📊 선별된 뉴스 카테고리 분포: {dict(sorted(selected_categories.items()))}")
         
@@ -201,6 +196,7 @@ def validate_environment():
     required_files = [
         'advanced_news_collector.py',
         'advanced_classifier.py', 
+        'keyword_matcher.py',
         'news_delivery_system.py',
         'json_generator.py'
     ]
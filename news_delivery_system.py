@@ -8,6 +8,7 @@ import smtplib
 import logging
 import json
 import os
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Dict
 from email.mime.text import MIMEText
@@ -120,12 +121,9 @@ class NewsDeliverySystem:
         message = f"음악 업계 뉴스 브리핑 - {datetime.now().strftime('%Y년 %m월 %d일')}\n"
         
         # 카테고리별로 그룹화
-        categorized_news = {}
+        categorized_news = defaultdict(list)
         for news in news_list:
-            category = news.get('category', 'NEWS')
-            if category not in categorized_news:
-                categorized_news[category] = []
-            categorized_news[category].append(news)
+            categorized_news[news.get('category', 'NEWS')].append(news)
         
         # 카테고리 이모지 매핑
         category_emojis = {
@@ -284,12 +282,9 @@ class NewsDeliverySystem:
         """
         
         # 카테고리별로 그룹화
-        categorized_news = {}
+        categorized_news = defaultdict(list)
         for news in news_list:
-            category = news.get('category', 'NEWS')
-            if category not in categorized_news:
-                categorized_news[category] = []
-            categorized_news[category].append(news)
+            categorized_news[news.get('category', 'NEWS')].append(news)
         
         # 카테고리별 뉴스 추가
         for category, news_items in categorized_news.items():